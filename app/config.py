@@ -7,6 +7,17 @@ from textwrap import dedent
 APP_SECRET = os.getenv("APP_SECRET", "change_me")
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./app.db")
 
+# Startup / cold start
+# LAZY_STARTUP=1: import routers on first request to their prefix and run the
+# schema step in the background so the port opens immediately.
+LAZY_STARTUP = os.getenv("LAZY_STARTUP", "0") == "1"
+# DB_SCHEMA_MODE: "create" (create_all every boot), "check" (one inspect query,
+# create_all only if tables are missing) or "skip" (run `python -m app.db` as a
+# release/migration step instead).
+DB_SCHEMA_MODE = os.getenv("DB_SCHEMA_MODE", "create").strip().lower()
+if DB_SCHEMA_MODE not in ("create", "check", "skip"):
+    raise ValueError(f"DB_SCHEMA_MODE must be create, check or skip, got {DB_SCHEMA_MODE!r}")
+
 # Zoho OAuth
 ZOHO_CLIENT_ID = os.getenv("ZOHO_CLIENT_ID", "")
 ZOHO_CLIENT_SECRET = os.getenv("ZOHO_CLIENT_SECRET", "")
@@ -14,6 +25,10 @@ ZOHO_REDIRECT_URI = os.getenv("ZOHO_REDIRECT_URI", "http://localhost:8000/oauth/
 ZOHO_SCOPES = os.getenv("ZOHO_SCOPES", "ZohoBooks.fullaccess.all")
 ZOHO_DC = os.getenv("ZOHO_DC", "com")
 
+# Uploads (S3 when both are set, else ./uploads)
+S3_BUCKET = os.getenv("S3_BUCKET", "")
+S3_REGION = os.getenv("S3_REGION", "")
+
 # OCR / Google Vision
 USE_GCVISION = os.getenv("USE_GCVISION", "0") == "1"
 GOOGLE_APPLICATION_CREDENTIALS = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "")
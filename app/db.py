@@ -1,5 +1,5 @@
 from sqlmodel import SQLModel, create_engine, Session
-from .config import DATABASE_URL
+from .config import DATABASE_URL, DB_SCHEMA_MODE
 
 # Normalize Railway's postgres:// URL to postgresql:// for SQLAlchemy
 if DATABASE_URL.startswith("postgres://"):
@@ -10,10 +10,32 @@ connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite")
 
 engine = create_engine(DATABASE_URL, connect_args=connect_args)
 
-def init_db():
+def init_db(mode: str = DB_SCHEMA_MODE):
+    """
+    create: create_all on every boot (original behaviour)
+    check:  one inspect query; create_all only when a table is missing
+    skip:   nothing, schema is handled by `python -m app.db`
+    """
+    if mode == "skip":
+        return
     from . import models  # noqa: F401
+    if mode == "check":
+        from sqlalchemy import inspect
+        existing = set(inspect(engine).get_table_names())
+        if set(SQLModel.metadata.tables) <= existing:
+            return
     SQLModel.metadata.create_all(engine)
 
+def ping_db():
+    from sqlalchemy import text
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
 def get_session():
     with Session(engine) as session:
         yield session
+
+if __name__ == "__main__":
+    # Migration / release step: `python -m app.db`
+    init_db("create")
+    print("schema ok")
@@ -1,9 +1,36 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from .routers import oauth_zoho, companies, accounts, rules, ocr, books
+from .utils.startup import timed, state, schema_done, report, log_report
+
+with timed("import:fastapi"):
+    from fastapi import FastAPI
+    from fastapi.concurrency import run_in_threadpool
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import JSONResponse
+
+import importlib
+import threading
+
+from .config import LAZY_STARTUP
 
 # ✅ import init_db
-from .db import init_db
+with timed("import:app.db"):
+    from .db import init_db, ping_db
+
+# (prefix, module, tag) — modules are imported eagerly, or on first request
+# to their prefix when LAZY_STARTUP=1
+ROUTERS = [
+    ("/oauth/zoho", "oauth_zoho", "oauth"),
+    ("/companies", "companies", "companies"),
+    ("/accounts", "accounts", "accounts"),
+    ("/rules", "rules", "rules"),
+    ("/ocr", "ocr", "ocr"),
+    ("/books", "books", "books"),
+]
+# Routers that never touch the DB and so need not wait for the schema step
+NO_DB_ROUTERS = {"ocr"}
+
+# How long a DB-backed request waits for the background schema step before
+# getting a 503 with Retry-After
+SCHEMA_WAIT_S = 15
 
 app = FastAPI(title="Zoho Multi-company Journal Backend")
 
@@ -15,18 +42,105 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+_loaded = set()
+_load_lock = threading.Lock()
+
+def _include(prefix: str, module: str, tag: str):
+    with _load_lock:
+        if module in _loaded:
+            return
+        with timed(f"import:routers.{module}"):
+            mod = importlib.import_module(f".routers.{module}", __package__)
+        app.include_router(mod.router, prefix=prefix, tags=[tag])
+        app.openapi_schema = None  # rebuild docs with the new routes
+        _loaded.add(module)
+
+def _include_all():
+    for prefix, module, tag in ROUTERS:
+        _include(prefix, module, tag)
+
+class _LazyRouters:
+    """
+    Plain ASGI middleware: include a router on the first request to its
+    prefix, and hold DB-backed requests until the background schema step is
+    done. Imports and waits run in the threadpool so they do not block the
+    event loop; the middleware is a pass-through once both are finished.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and (len(_loaded) < len(ROUTERS) or not schema_done.is_set()):
+            # Starlette keeps root_path in scope["path"]; routers are mounted
+            # without it, so match on the route path like the router does
+            path = scope["path"]
+            root_path = scope.get("root_path", "")
+            if root_path and path.startswith(root_path):
+                path = path[len(root_path):] or "/"
+            if path in (app.openapi_url, app.docs_url, app.redoc_url):
+                await run_in_threadpool(_include_all)
+            for prefix, module, tag in ROUTERS:
+                if path == prefix or path.startswith(prefix + "/"):
+                    if module not in _loaded:
+                        await run_in_threadpool(_include, prefix, module, tag)
+                    if module not in NO_DB_ROUTERS and not state["ready"]:
+                        await run_in_threadpool(schema_done.wait, SCHEMA_WAIT_S)
+                        if not state["ready"]:
+                            resp = JSONResponse(
+                                {"detail": "starting up", "error": state["error"]},
+                                status_code=503,
+                                headers={"Retry-After": "5"},
+                            )
+                            await resp(scope, receive, send)
+                            return
+                    break
+        await self.app(scope, receive, send)
+
+if LAZY_STARTUP:
+    app.add_middleware(_LazyRouters)
+else:
+    _include_all()
+
+def _run_init_db():
+    try:
+        with timed("init:db_schema"):
+            init_db()
+        state["ready"] = True
+    except Exception as e:
+        state["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        schema_done.set()
+        log_report()
+
 # ✅ run init_db at startup so tables exist
+# (in LAZY_STARTUP mode it runs in the background; DB-backed requests wait for
+# it in _LazyRouters and /ready reports when done)
 @app.on_event("startup")
 def _init():
-    init_db()
-
-app.include_router(oauth_zoho.router, prefix="/oauth/zoho", tags=["oauth"])
-app.include_router(companies.router, prefix="/companies", tags=["companies"])
-app.include_router(accounts.router, prefix="/accounts", tags=["accounts"])
-app.include_router(rules.router, prefix="/rules", tags=["rules"])
-app.include_router(ocr.router, prefix="/ocr", tags=["ocr"])
-app.include_router(books.router, prefix="/books", tags=["books"])
+    if LAZY_STARTUP:
+        threading.Thread(target=_run_init_db, name="init_db", daemon=True).start()
+    else:
+        _run_init_db()
 
 @app.get("/health")
 def health():
+    # Liveness only: never touches the DB or heavy imports
     return {"ok": True}
+
+@app.get("/ready")
+def ready():
+    if not state["ready"]:
+        return JSONResponse({"ready": False, "error": state["error"]}, status_code=503)
+    try:
+        ping_db()
+    except Exception as e:
+        return JSONResponse({"ready": False, "error": f"db: {e}"}, status_code=503)
+    return {"ready": True}
+
+@app.get("/startup")
+def startup_report():
+    out = report()
+    out["lazy"] = LAZY_STARTUP
+    out["routers_loaded"] = sorted(_loaded)
+    return out
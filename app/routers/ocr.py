@@ -4,7 +4,6 @@ from pydantic import BaseModel
 from typing import Optional, Tuple
 import os, io, re
 from datetime import datetime
-from PIL import Image
 from ..config import USE_GCVISION  # assumes your config sets GOOGLE_APPLICATION_CREDENTIALS when GCP_SA_JSON exists
 
 router = APIRouter()
@@ -153,6 +152,7 @@ async def upload(file: UploadFile = File(...)):
 
         # Light pre-processing: upscale very small screenshots to help OCR
         if len(content) < 150_000:
+            from PIL import Image  # deferred: keeps Pillow out of cold start
             img = Image.open(io.BytesIO(content)).convert("RGB")
             w, h = img.size
             if max(w, h) < 1200:
@@ -0,0 +1,49 @@
+# app/utils/startup.py
+import time
+import logging
+import threading
+from contextlib import contextmanager
+
+# uvicorn only configures its own loggers, so report through one of them
+log = logging.getLogger("uvicorn.error")
+
+_T0 = time.perf_counter()
+
+# label -> seconds, in the order things were measured. Written from the
+# threadpool (lazy router imports) and the init_db thread, read from requests.
+timings: dict = {}
+_lock = threading.Lock()
+
+# Flipped once the schema step has finished (see main._init); schema_done is
+# set either way so waiting requests can check state["ready"]
+state = {"ready": False, "error": None}
+schema_done = threading.Event()
+
+@contextmanager
+def timed(label: str):
+    """
+    Record how long the wrapped import / init step takes under `label`.
+    """
+    t = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - t
+        with _lock:
+            timings[label] = timings.get(label, 0.0) + elapsed
+
+def _snapshot() -> list:
+    with _lock:
+        return list(timings.items())
+
+def report() -> dict:
+    return {
+        "ready": state["ready"],
+        "error": state["error"],
+        "since_import_s": round(time.perf_counter() - _T0, 4),
+        "steps_ms": {k: round(v * 1000, 2) for k, v in _snapshot()},
+    }
+
+def log_report():
+    steps = ", ".join(f"{k}={v * 1000:.1f}ms" for k, v in _snapshot())
+    log.info("startup timings: %s", steps or "none")
@@ -1,8 +1,9 @@
-import os, boto3, uuid, pathlib
+import os, uuid, pathlib
 from ..config import S3_BUCKET, S3_REGION
 
 def save_bytes(content: bytes, filename: str) -> str:
     if S3_BUCKET and S3_REGION:
+        import boto3  # deferred: boto3 is slow to import
         s3 = boto3.client('s3', region_name=S3_REGION)
         key = f"uploads/{uuid.uuid4().hex}_{filename}"
         s3.put_object(Bucket=S3_BUCKET, Key=key, Body=content, ContentType='application/octet-stream')